@@ -6,6 +6,40 @@ A comprehensive tool for analyzing and processing customer feedback data
 
 from feedback_interface import FeedbackAnalyzerInterface
 import argparse
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Per-worker processor instance, created once by _init_worker so each
+# process pays the setup cost a single time across its whole batch
+_worker_processor = None
+
+def _init_worker():
+    """Initialize one FeedbackProcessor per worker process"""
+    global _worker_processor
+    from feedback_processor import FeedbackProcessor
+    _worker_processor = FeedbackProcessor()
+
+def _analyze_file(file_path, analysis_type):
+    """Analyze a single file inside a worker process"""
+    return _worker_processor.analyze_feedback(file_path, analysis_type)
+
+def run_headless(files, analysis_type):
+    """
+    Run the requested analysis over one or more files.
+    Multiple files are fanned out across CPU cores in a process pool so
+    CPU-bound analysis scales without GIL contention.
+    """
+    if len(files) == 1:
+        from feedback_processor import FeedbackProcessor
+        print(FeedbackProcessor().analyze_feedback(files[0], analysis_type))
+        return
+    chunksize = max(1, len(files) // ((os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor(initializer=_init_worker) as executor:
+        results = executor.map(_analyze_file, files,
+                               [analysis_type] * len(files),
+                               chunksize=chunksize)
+        print("\n".join(results))
 
 def main():
     """
@@ -14,14 +48,20 @@ def main():
     """
     parser = argparse.ArgumentParser(description="Customer Feedback Analysis System")
     parser.add_argument('--headless', action='store_true', help='Run in headless (no-GUI) mode for batch processing')
-    parser.add_argument('--file', type=str, help='Path to feedback data file')
+    parser.add_argument('--file', type=str, help='Path to feedback data file (comma-separated for multiple files)')
+    parser.add_argument('--glob', dest='glob_pattern', type=str, help='Glob pattern matching feedback data files')
     parser.add_argument('--type', type=str, choices=['sentiment', 'keywords', 'topics', 'summary'], help='Type of analysis to perform')
     args = parser.parse_args()
-    if args.headless and args.file and args.type:
-        from feedback_processor import FeedbackProcessor
-        processor = FeedbackProcessor()
-        result = processor.analyze_feedback(args.file, args.type)
-        print(result)
+    if args.headless and args.type and (args.file or args.glob_pattern):
+        files = []
+        if args.file:
+            files.extend(path for path in args.file.split(',') if path)
+        if args.glob_pattern:
+            files.extend(sorted(glob.glob(args.glob_pattern)))
+        if not files:
+            print("Error: No input files matched.")
+            return 1
+        run_headless(files, args.type)
         return 0
     try:
         analyzer = FeedbackAnalyzerInterface()
@@ -32,4 +72,4 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    exit(main()) 
\ No newline at end of file
+    exit(main())
@@ -6,6 +6,7 @@ Provides a graphical user interface for customer feedback analysis
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from feedback_processor import FeedbackProcessor
 from data_visualizer import DataVisualizer
 
@@ -20,6 +21,15 @@ class FeedbackAnalyzerInterface:
         self.processor = FeedbackProcessor()
         self.visualizer = DataVisualizer()
         self.setup_interface()
+        # Single-worker pool so repeated clicks can't pile up concurrent runs
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._analysis_future = None
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Shut down the worker pool so closing the window exits promptly"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
         
     def setup_window(self):
         """Configure the main window properties and add menu bar"""
@@ -202,41 +212,50 @@ class FeedbackAnalyzerInterface:
             self.file_path_var.set(filename)
             
     def start_analysis(self):
-        """Start the analysis process in a separate thread"""
+        """Start the analysis process on the worker executor"""
         if not self.file_path_var.get():
             messagebox.showerror("Error", "Please select a data file first!")
             return
-            
+
+        # Coalesce rapid clicks: skip if an analysis is already in flight
+        if self._analysis_future is not None and not self._analysis_future.done():
+            return
+
         # Disable buttons during analysis
         self.root.config(cursor="wait")
-        
-        # Run analysis in separate thread
-        thread = threading.Thread(target=self.perform_analysis)
-        thread.daemon = True
-        thread.start()
-        
+
+        self._analysis_future = self._executor.submit(self.perform_analysis)
+
     def perform_analysis(self):
         """Perform the actual analysis"""
         try:
             file_path = self.file_path_var.get()
             analysis_type = self.analysis_type.get()
-            
+
             # Process the data
             results = self.processor.analyze_feedback(file_path, analysis_type)
-            
-            # Update UI in main thread
+
+            # Hand results to the main thread; after() is the documented
+            # thread-safe way to call back into Tk
             self.root.after(0, self.display_results, results)
-            
+
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Analysis Error", str(e)))
+            msg = str(e)
+            self.root.after(0, lambda: messagebox.showerror("Analysis Error", msg))
         finally:
             self.root.after(0, lambda: self.root.config(cursor=""))
-            
+
     def display_results(self, results):
         """Display analysis results in the text area"""
+        # Insert in 64 KiB chunks so Tk re-indexes incrementally instead of
+        # reflowing one huge string, then trigger a single idle redraw
+        self.results_text.config(state='normal')
         self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, results)
-        
+        for i in range(0, len(results), 65536):
+            self.results_text.insert(tk.END, results[i:i + 65536])
+        self.results_text.config(state='disabled')
+        self.results_text.update_idletasks()
+
     def export_results(self):
         """Export results to a file"""
         if not self.results_text.get(1.0, tk.END).strip():
@@ -250,15 +269,29 @@ class FeedbackAnalyzerInterface:
         )
         
         if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(self.results_text.get(1.0, tk.END))
-                messagebox.showinfo("Success", "Results exported successfully!")
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export: {e}")
-                
+            # Write on a worker thread so large exports don't stall the UI
+            text = self.results_text.get(1.0, tk.END)
+            thread = threading.Thread(target=self._write_results, args=(filename, text))
+            thread.daemon = True
+            thread.start()
+
+    def _write_results(self, filename, text):
+        """Write exported results to disk off the Tk main thread"""
+        try:
+            # 1 MiB buffer keeps syscall count low on multi-MB reports
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                f.write(text)
+        except Exception as e:
+            # Bind the message now: the except variable is unbound once the
+            # block exits, before the deferred callback runs
+            msg = f"Failed to export: {e}"
+            self.root.after(0, lambda: messagebox.showerror("Export Error", msg))
+        else:
+            self.root.after(0, lambda: messagebox.showinfo("Success", "Results exported successfully!"))
+
     def clear_results(self):
         """Clear the results display"""
+        self.results_text.config(state='normal')
         self.results_text.delete(1.0, tk.END)
         
     def start_application(self):
@@ -4,11 +4,182 @@ Handles the core logic for analyzing customer feedback data
 """
 
 import pandas as pd
+import numpy as np
 import re
-from collections import Counter
+import os
+import io
+import functools
+from concurrent.futures import ProcessPoolExecutor
 import json
 from datetime import datetime
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Row count above which sentiment scoring fans out across CPU cores
+_PARALLEL_MIN_ROWS = 100_000
+
+# Tokenizer and stop word list shared by the keyword and summary paths;
+# frozenset gives cheap, mutation-free membership and the pattern object
+# is created exactly once per process
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+
+# Column-name substrings that identify the feedback column, shared by the
+# CSV header probe and get_feedback_column
+_FEEDBACK_COL_NAMES = ('feedback', 'review', 'comment', 'text', 'message', 'response')
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have',
+    'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'may', 'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you',
+    'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'
+})
+
+def _distinct_hits(s, pattern):
+    """
+    Count the distinct lexicon words each row matches
+
+    Presence semantics, matching the original per-word membership checks:
+    a word repeated in one row still counts once.
+
+    Args:
+        s (pandas.Series): Lowercased feedback strings
+        pattern: Compiled alternation regex (or its pattern string)
+
+    Returns:
+        pandas.Series: Distinct match count per row
+    """
+    return s.str.findall(pattern).map(lambda matches: len(set(matches)))
+
+def _score_chunk(texts, pos_pattern, neg_pattern):
+    """
+    Score one chunk of lowered texts in a worker process
+
+    Patterns travel as strings so the work items stay trivially picklable;
+    each worker compiles them once per chunk.
+    """
+    s = pd.Series(texts)
+    positive_hits = _distinct_hits(s, pos_pattern)
+    negative_hits = _distinct_hits(s, neg_pattern)
+    return (int((positive_hits > negative_hits).sum()),
+            int((negative_hits > positive_hits).sum()))
+
+def _lower_ascii_inplace(buf):
+    """
+    Lowercase ASCII letters in a uint8 buffer in place
+
+    Views the aligned body of the buffer as uint64 lanes and processes
+    eight bytes per operation (SWAR). For an ASCII byte t, the expression
+    (t + 0x3f) & ~(t + 0x25) & 0x80 sets the high bit exactly when t is in
+    'A'..'Z'; shifting that bit down to 0x20 and OR-ing it back flips the
+    letter to lowercase. Bytes with the high bit set (multi-byte UTF-8)
+    are masked out and left untouched.
+
+    Args:
+        buf (numpy.ndarray): Writable contiguous uint8 buffer
+    """
+    n = buf.shape[0] & ~7
+    lanes = buf[:n].view(np.uint64)
+    low7 = lanes & np.uint64(0x7f7f7f7f7f7f7f7f)
+    is_upper = ((low7 + np.uint64(0x3f3f3f3f3f3f3f3f))
+                & ~(low7 + np.uint64(0x2525252525252525))
+                & ~lanes & np.uint64(0x8080808080808080))
+    lanes |= is_upper >> np.uint64(2)
+    tail = buf[n:]
+    upper = (tail >= 65) & (tail <= 90)
+    tail[upper] += 32
+
+_HASH_MASK = (1 << 64) - 1
+
+def _hash_word(word):
+    """Rolling hash of an encoded word, matching the JIT kernel's arithmetic"""
+    h = 0
+    for byte in word.encode('utf-8'):
+        h = (h * 31 + byte) & _HASH_MASK
+    return h
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _hash_index(sorted_hashes, h):
+        """Binary search a sorted uint64 hash array; index of h, or -1"""
+        lo = 0
+        hi = sorted_hashes.shape[0]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = sorted_hashes[mid]
+            if value < h:
+                lo = mid + 1
+            elif value > h:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    @njit(cache=True)
+    def _popcount(mask):
+        """Number of set bits in a uint64"""
+        count = 0
+        while mask:
+            mask &= mask - np.uint64(1)
+            count += 1
+        return count
+
+    @njit(cache=True)
+    def _score_packed(buf, offsets, pos_hashes, neg_hashes):
+        """
+        Classify each packed text slice as positive/negative/neutral
+
+        Walks the shared uint8 buffer once, rolling-hashes each run of
+        lowercase ASCII letters and checks it against the sorted lexicon
+        hash arrays. Distinct matched words per row are tracked in uint64
+        bitmasks (both lexicons hold well under 64 words), preserving
+        presence semantics. Returns (positive_count, negative_count).
+        """
+        positive_count = 0
+        negative_count = 0
+        mul = np.uint64(31)
+        one = np.uint64(1)
+        for i in range(offsets.shape[0] - 1):
+            end = offsets[i + 1]
+            pos_mask = np.uint64(0)
+            neg_mask = np.uint64(0)
+            h = np.uint64(0)
+            token_len = 0
+            for j in range(offsets[i], end + 1):
+                if j < end:
+                    c = int(buf[j])
+                else:
+                    c = 0
+                if 97 <= c <= 122:
+                    h = h * mul + np.uint64(c)
+                    token_len += 1
+                elif token_len > 0:
+                    idx = _hash_index(pos_hashes, h)
+                    if idx >= 0:
+                        pos_mask |= one << np.uint64(idx)
+                    else:
+                        idx = _hash_index(neg_hashes, h)
+                        if idx >= 0:
+                            neg_mask |= one << np.uint64(idx)
+                    h = np.uint64(0)
+                    token_len = 0
+            pos = _popcount(pos_mask)
+            neg = _popcount(neg_mask)
+            if pos > neg:
+                positive_count += 1
+            elif neg > pos:
+                negative_count += 1
+        return positive_count, negative_count
+
 class FeedbackProcessor:
     """
     Main class for processing and analyzing customer feedback
@@ -26,7 +197,193 @@ class FeedbackProcessor:
             'angry', 'upset', 'hate', 'dislike', 'poor', 'worst', 'useless',
             'broken', 'defective', 'slow', 'expensive', 'difficult', 'confusing'
         }
-        
+        self.stop_words = _STOP_WORDS
+        self.topics = {
+            'Customer Service': ['service', 'support', 'help', 'assistant', 'representative', 'agent'],
+            'Product Quality': ['quality', 'product', 'item', 'goods', 'material', 'durability'],
+            'Price/Value': ['price', 'cost', 'expensive', 'cheap', 'value', 'worth', 'money'],
+            'Delivery/Shipping': ['delivery', 'shipping', 'arrived', 'package', 'mail', 'transport'],
+            'Website/App': ['website', 'app', 'online', 'interface', 'user', 'navigation'],
+            'Communication': ['communication', 'email', 'phone', 'message', 'contact', 'response']
+        }
+        # One compiled alternation per word set: each string is scanned once
+        # instead of once per word
+        self._pos_re = re.compile(r'\b(?:' + '|'.join(map(re.escape, self.positive_words)) + r')\b')
+        self._neg_re = re.compile(r'\b(?:' + '|'.join(map(re.escape, self.negative_words)) + r')\b')
+        self._stop_re = re.compile(r'\b(?:' + '|'.join(map(re.escape, self.stop_words)) + r')\b')
+        self._topic_regex = {
+            topic: re.compile(r'\b(?:' + '|'.join(map(re.escape, keywords)) + r')\b')
+            for topic, keywords in self.topics.items()
+        }
+        # With pyahocorasick installed, one automaton sweep per string finds
+        # every dictionary hit regardless of how many keywords are registered
+        self._sent_ac = None
+        self._topic_ac = None
+        if AHOCORASICK_AVAILABLE:
+            self._sent_ac = ahocorasick.Automaton()
+            for word in self.positive_words:
+                self._sent_ac.add_word(word, ('pos', word))
+            for word in self.negative_words:
+                self._sent_ac.add_word(word, ('neg', word))
+            self._sent_ac.make_automaton()
+            self._topic_ac = ahocorasick.Automaton()
+            for topic, keywords in self.topics.items():
+                for keyword in keywords:
+                    self._topic_ac.add_word(keyword, (topic, keyword))
+            self._topic_ac.make_automaton()
+        # Sorted lexicon hashes for the Numba scoring kernel; hashing the
+        # words here with the same arithmetic the kernel uses keeps the two
+        # sides comparable
+        if NUMBA_AVAILABLE:
+            self._pos_hashes = np.sort(np.fromiter(
+                (_hash_word(word) for word in self.positive_words),
+                dtype=np.uint64, count=len(self.positive_words)))
+            self._neg_hashes = np.sort(np.fromiter(
+                (_hash_word(word) for word in self.negative_words),
+                dtype=np.uint64, count=len(self.negative_words)))
+        # Per-instance parse cache keyed by (path, mtime): running all four
+        # analyses on the same unchanged file parses it once, not four times
+        self._cached_load = functools.lru_cache(maxsize=8)(self._load_versioned)
+
+    @staticmethod
+    def _arrow_backed(data):
+        """
+        Back string columns with pyarrow storage when available
+
+        Arrow string arrays keep one contiguous byte buffer plus offsets
+        instead of a Python object per cell, roughly halving memory and
+        running .str operations on Arrow compute kernels. Without pyarrow
+        the frame is returned unchanged.
+
+        Args:
+            data (pandas.DataFrame): Loaded data
+
+        Returns:
+            pandas.DataFrame: Data with pyarrow-backed string columns
+        """
+        try:
+            for col in data.columns:
+                if pd.api.types.is_string_dtype(data[col]):
+                    data[col] = data[col].astype('string[pyarrow]')
+        except ImportError:
+            pass
+        return data
+
+    @staticmethod
+    def _pack_texts(texts):
+        """
+        Pack strings into one contiguous uint8 buffer with slice offsets
+
+        Args:
+            texts (sequence): Strings to pack
+
+        Returns:
+            tuple: (uint8 buffer, int64 offsets of length len(texts) + 1)
+        """
+        encoded = [text.encode('utf-8', errors='replace') for text in texts]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter((len(b) for b in encoded),
+                              dtype=np.int64, count=len(encoded)),
+                  out=offsets[1:])
+        joined = b''.join(encoded)
+        # Copy into an owned array: frombuffer views are read-only and may
+        # be unaligned, and the SWAR lowercase pass mutates the buffer
+        buf = np.empty(len(joined), dtype=np.uint8)
+        buf[:] = np.frombuffer(joined, dtype=np.uint8)
+        return buf, offsets
+
+    @staticmethod
+    def _ac_word_hits(automaton, text):
+        """
+        Yield automaton values whose matches fall on word boundaries
+
+        Args:
+            automaton: A built ahocorasick.Automaton
+            text (str): Lowercased text to scan
+
+        Yields:
+            tuple: The value stored for each boundary-respecting match
+        """
+        last = len(text) - 1
+        for end, value in automaton.iter(text):
+            start = end - len(value[1]) + 1
+            if ((start == 0 or not text[start - 1].isalpha())
+                    and (end == last or not text[end + 1].isalpha())):
+                yield value
+
+    def _sentiment_counts(self, s):
+        """
+        Count rows classified as positive/negative for a lowered column
+
+        Args:
+            s (pandas.Series): Lowercased feedback strings
+
+        Returns:
+            tuple: (positive_count, negative_count)
+        """
+        if NUMBA_AVAILABLE:
+            # Compiled kernel: one pass over a packed byte buffer with the
+            # lexicons looked up through sorted hash arrays
+            buf, offsets = self._pack_texts(s.to_numpy())
+            # Branch-free SWAR lowercase keeps the kernel correct for
+            # mixed-case input without a per-character Python pass
+            _lower_ascii_inplace(buf)
+            return _score_packed(buf, offsets, self._pos_hashes, self._neg_hashes)
+        if self._sent_ac is not None:
+            positive_count = 0
+            negative_count = 0
+            for text in s.to_numpy():
+                # Sets keep presence semantics: a repeated word counts once
+                pos_seen = set()
+                neg_seen = set()
+                for tag, word in self._ac_word_hits(self._sent_ac, text):
+                    if tag == 'pos':
+                        pos_seen.add(word)
+                    else:
+                        neg_seen.add(word)
+                if len(pos_seen) > len(neg_seen):
+                    positive_count += 1
+                elif len(neg_seen) > len(pos_seen):
+                    negative_count += 1
+            return positive_count, negative_count
+        if len(s) >= _PARALLEL_MIN_ROWS and (os.cpu_count() or 1) > 1:
+            # The scan is embarrassingly parallel across rows: split the
+            # column and sum the per-chunk classifications
+            n_workers = os.cpu_count()
+            chunks = np.array_split(s.to_numpy(), n_workers)
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                parts = executor.map(_score_chunk, chunks,
+                                     [self._pos_re.pattern] * n_workers,
+                                     [self._neg_re.pattern] * n_workers)
+                positive_count = 0
+                negative_count = 0
+                for pos, neg in parts:
+                    positive_count += pos
+                    negative_count += neg
+            return positive_count, negative_count
+        positive_hits = _distinct_hits(s, self._pos_re)
+        negative_hits = _distinct_hits(s, self._neg_re)
+        return (int((positive_hits > negative_hits).sum()),
+                int((negative_hits > positive_hits).sum()))
+
+    def _text_array(self, data, feedback_col):
+        """
+        Return the feedback column coerced to str and lowercased
+
+        One vectorized conversion shared by every analysis method, replacing
+        the per-row str(...).lower() coercions they each used to perform.
+        Missing cells become empty strings so every downstream backend
+        (regex, automaton, packed kernel) only ever sees str values.
+
+        Args:
+            data (pandas.DataFrame): Feedback data
+            feedback_col (str): Name of the feedback column
+
+        Returns:
+            pandas.Series: Lowercased feedback strings
+        """
+        return data[feedback_col].astype(str).fillna('').str.lower()
+
     def analyze_feedback(self, file_path, analysis_type):
         """
         Main method to analyze feedback based on the specified type
@@ -39,8 +396,13 @@ class FeedbackProcessor:
             str: Formatted analysis results
         """
         try:
-            # Load and validate data
-            data = self.load_data(file_path)
+            # Load and validate data, reusing a cached parse when the file
+            # is unchanged; the mtime in the key invalidates stale entries
+            try:
+                mtime = os.stat(file_path).st_mtime_ns
+            except OSError:
+                mtime = None
+            data = self._cached_load(file_path, mtime)
             if data is None or data.empty:
                 return "Error: No valid data found in the file."
                 
@@ -58,32 +420,99 @@ class FeedbackProcessor:
                 
         except Exception as e:
             return f"Analysis error: {str(e)}"
-            
-    def load_data(self, file_path):
+
+    def _load_versioned(self, file_path, mtime):
+        """
+        Load a file for the parse cache; mtime only participates in the key
+
+        Args:
+            file_path (str): Path to the data file
+            mtime (int): File modification time in nanoseconds, or None
+
+        Returns:
+            pandas.DataFrame: Loaded data
+        """
+        return self.load_data(file_path)
+
+    def load_data(self, file_path, analysis_type=None):
         """
         Load data from various file formats
-        
+
         Args:
             file_path (str): Path to the data file
-            
+            analysis_type (str, optional): Analysis the data is loaded for,
+                letting format-specific branches specialize the read
+
         Returns:
             pandas.DataFrame: Loaded data
         """
         try:
             file_extension = file_path.lower().split('.')[-1]
-            
+
             if file_extension == 'csv':
-                return pd.read_csv(file_path, encoding='utf-8')
+                # Resolve the feedback column from the header alone, then
+                # re-read only that column; the pyarrow engine parses it
+                # multithreaded when installed
+                header_cols = pd.read_csv(file_path, nrows=0, encoding='utf-8').columns
+                feedback_col = next((col for col in header_cols
+                                     if any(name in col.lower() for name in _FEEDBACK_COL_NAMES)), None)
+                if feedback_col is None:
+                    data = pd.read_csv(file_path, encoding='utf-8')
+                else:
+                    try:
+                        data = pd.read_csv(file_path, usecols=[feedback_col],
+                                           dtype={feedback_col: 'string'},
+                                           engine='pyarrow', encoding='utf-8')
+                    except ImportError:
+                        data = pd.read_csv(file_path, usecols=[feedback_col],
+                                           dtype={feedback_col: 'string'},
+                                           encoding='utf-8')
             elif file_extension == 'xlsx':
-                return pd.read_excel(file_path)
+                # Mirror the CSV branch: probe the header, then read only
+                # the feedback column. The calamine engine parses xlsx
+                # several times faster than openpyxl when installed
+                try:
+                    header_cols = pd.read_excel(file_path, nrows=0, engine='calamine').columns
+                except ImportError:
+                    header_cols = pd.read_excel(file_path, nrows=0).columns
+                feedback_col = next((col for col in header_cols
+                                     if any(name in col.lower() for name in _FEEDBACK_COL_NAMES)), None)
+                usecols = [feedback_col] if feedback_col is not None else None
+                try:
+                    data = pd.read_excel(file_path, usecols=usecols, engine='calamine')
+                except ImportError:
+                    data = pd.read_excel(file_path, usecols=usecols)
             elif file_extension == 'txt':
-                # For text files, assume one feedback per line
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                return pd.DataFrame({'feedback': [line.strip() for line in lines if line.strip()]})
+                # For text files, assume one feedback per line. The NUL
+                # separator makes pandas' C parser treat each line as one
+                # field, reading the file in a single pass instead of
+                # readlines() plus Python-level filtering
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+                try:
+                    if b'\x00' in raw:
+                        # A NUL inside a line would split it into extra
+                        # fields and silently corrupt the parse
+                        raise pd.errors.ParserError('NUL byte in input')
+                    df = pd.read_csv(io.BytesIO(raw), sep='\x00', header=None,
+                                     names=['feedback'], dtype='string',
+                                     skip_blank_lines=True, engine='c',
+                                     quoting=3, encoding='utf-8')
+                    df['feedback'] = df['feedback'].str.strip()
+                    data = df[df['feedback'].str.len() > 0]
+                except pd.errors.ParserError:
+                    # Degrade to the line-by-line path instead of dropping
+                    # or truncating rows
+                    lines = raw.decode('utf-8').splitlines()
+                    data = pd.DataFrame(
+                        {'feedback': [line.strip() for line in lines if line.strip()]})
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
-                
+
+            # Move string columns onto contiguous Arrow storage when
+            # pyarrow is installed
+            return self._arrow_backed(data)
+
         except Exception as e:
             print(f"Error loading data: {e}")
             return None
@@ -98,45 +527,24 @@ class FeedbackProcessor:
         Returns:
             str: Sentiment analysis results
         """
-        results = []
-        results.append("=== SENTIMENT ANALYSIS RESULTS ===\n")
-        
         # Determine the feedback column
         feedback_col = self.get_feedback_column(data)
         if feedback_col is None:
             return "Error: Could not identify feedback column in data."
             
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-        total_feedback = 0
-        
-        for _, row in data.iterrows():
-            feedback_text = str(row[feedback_col]).lower()
-            total_feedback += 1
-            
-            # Count positive and negative words
-            positive_words_found = sum(1 for word in self.positive_words if word in feedback_text)
-            negative_words_found = sum(1 for word in self.negative_words if word in feedback_text)
-            
-            if positive_words_found > negative_words_found:
-                positive_count += 1
-            elif negative_words_found > positive_words_found:
-                negative_count += 1
-            else:
-                neutral_count += 1
-                
+        # Lowercase the whole column once, then count lexicon hits with
+        # vectorized string matching instead of a Python loop per row
+        s = self._text_array(data, feedback_col)
+
+        positive_count, negative_count = self._sentiment_counts(s)
+        neutral_count = len(s) - positive_count - negative_count
+
         # Calculate percentages
         total = len(data)
         positive_pct = (positive_count / total) * 100 if total > 0 else 0
         negative_pct = (negative_count / total) * 100 if total > 0 else 0
         neutral_pct = (neutral_count / total) * 100 if total > 0 else 0
-        
-        results.append(f"Total feedback analyzed: {total}")
-        results.append(f"Positive feedback: {positive_count} ({positive_pct:.1f}%)")
-        results.append(f"Negative feedback: {negative_count} ({negative_pct:.1f}%)")
-        results.append(f"Neutral feedback: {neutral_count} ({neutral_pct:.1f}%)")
-        
+
         # Overall sentiment
         if positive_pct > negative_pct:
             overall_sentiment = "POSITIVE"
@@ -144,10 +552,16 @@ class FeedbackProcessor:
             overall_sentiment = "NEGATIVE"
         else:
             overall_sentiment = "NEUTRAL"
-            
-        results.append(f"\nOverall Sentiment: {overall_sentiment}")
-        
-        return "\n".join(results)
+
+        # Assemble the report in one f-string instead of a list of appends
+        return (
+            "=== SENTIMENT ANALYSIS RESULTS ===\n\n"
+            f"Total feedback analyzed: {total}\n"
+            f"Positive feedback: {positive_count} ({positive_pct:.1f}%)\n"
+            f"Negative feedback: {negative_count} ({negative_pct:.1f}%)\n"
+            f"Neutral feedback: {neutral_count} ({neutral_pct:.1f}%)\n"
+            f"\nOverall Sentiment: {overall_sentiment}"
+        )
         
     def extract_keywords(self, data):
         """
@@ -159,39 +573,28 @@ class FeedbackProcessor:
         Returns:
             str: Keyword analysis results
         """
-        results = []
-        results.append("=== KEYWORD ANALYSIS RESULTS ===\n")
-        
         feedback_col = self.get_feedback_column(data)
         if feedback_col is None:
             return "Error: Could not identify feedback column in data."
             
-        # Collect all words
-        all_words = []
-        for _, row in data.iterrows():
-            feedback_text = str(row[feedback_col]).lower()
-            # Remove punctuation and split into words
-            words = re.findall(r'\b[a-zA-Z]+\b', feedback_text)
-            all_words.extend(words)
-            
-        # Remove common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'can', 'this', 'that', 'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they', 'me', 'him', 'her', 'us', 'them'}
-        
-        filtered_words = [word for word in all_words if word not in stop_words and len(word) > 2]
-        
-        # Count word frequencies
-        word_counts = Counter(filtered_words)
-        
-        # Get top keywords
-        top_keywords = word_counts.most_common(20)
-        
-        results.append("Top 20 Keywords:")
-        results.append("-" * 30)
-        
-        for word, count in top_keywords:
-            results.append(f"{word}: {count} occurrences")
-            
-        return "\n".join(results)
+        # Strip stop words with one precompiled alternation pass, then
+        # tokenize the whole column in one vectorized pass
+        s = self._text_array(data, feedback_col)
+        s = s.str.replace(self._stop_re, ' ', regex=True)
+        tokens = s.str.findall(_WORD_RE).explode().dropna()
+        tokens = tokens[tokens.str.len() > 2]
+
+        # Count word frequencies with pandas' hashed C grouping
+        top_keywords = tokens.value_counts().head(20)
+
+        keyword_lines = "\n".join(f"{word}: {count} occurrences"
+                                  for word, count in top_keywords.items())
+        return (
+            "=== KEYWORD ANALYSIS RESULTS ===\n\n"
+            "Top 20 Keywords:\n"
+            f"{'-' * 30}"
+            + (f"\n{keyword_lines}" if keyword_lines else "")
+        )
         
     def identify_topics(self, data):
         """
@@ -203,41 +606,33 @@ class FeedbackProcessor:
         Returns:
             str: Topic analysis results
         """
-        results = []
-        results.append("=== TOPIC ANALYSIS RESULTS ===\n")
-        
         feedback_col = self.get_feedback_column(data)
         if feedback_col is None:
             return "Error: Could not identify feedback column in data."
             
-        # Define topic keywords
-        topics = {
-            'Customer Service': ['service', 'support', 'help', 'assistant', 'representative', 'agent'],
-            'Product Quality': ['quality', 'product', 'item', 'goods', 'material', 'durability'],
-            'Price/Value': ['price', 'cost', 'expensive', 'cheap', 'value', 'worth', 'money'],
-            'Delivery/Shipping': ['delivery', 'shipping', 'arrived', 'package', 'mail', 'transport'],
-            'Website/App': ['website', 'app', 'online', 'interface', 'user', 'navigation'],
-            'Communication': ['communication', 'email', 'phone', 'message', 'contact', 'response']
-        }
-        
-        topic_counts = {topic: 0 for topic in topics}
-        
-        for _, row in data.iterrows():
-            feedback_text = str(row[feedback_col]).lower()
-            
-            for topic, keywords in topics.items():
-                if any(keyword in feedback_text for keyword in keywords):
+        s = self._text_array(data, feedback_col)
+        if self._topic_ac is not None:
+            # Single automaton sweep per row yields all topic hits at once
+            topic_counts = dict.fromkeys(self.topics, 0)
+            for text in s.to_numpy():
+                for topic in {value[0] for value in self._ac_word_hits(self._topic_ac, text)}:
                     topic_counts[topic] += 1
-                    
-        results.append("Topics Mentioned:")
-        results.append("-" * 30)
-        
-        for topic, count in sorted(topic_counts.items(), key=lambda x: x[1], reverse=True):
-            if count > 0:
-                percentage = (count / len(data)) * 100
-                results.append(f"{topic}: {count} mentions ({percentage:.1f}%)")
-                
-        return "\n".join(results)
+        else:
+            # One precompiled alternation match per topic instead of a
+            # rows x topics x keywords Python loop
+            topic_counts = {topic: int(s.str.contains(regex, regex=True).sum())
+                            for topic, regex in self._topic_regex.items()}
+
+        topic_lines = "\n".join(
+            f"{topic}: {count} mentions ({(count / len(data)) * 100:.1f}%)"
+            for topic, count in sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)
+            if count > 0)
+        return (
+            "=== TOPIC ANALYSIS RESULTS ===\n\n"
+            "Topics Mentioned:\n"
+            f"{'-' * 30}"
+            + (f"\n{topic_lines}" if topic_lines else "")
+        )
         
     def generate_summary(self, data):
         """
@@ -249,58 +644,43 @@ class FeedbackProcessor:
         Returns:
             str: Summary of feedback
         """
-        results = []
-        results.append("=== FEEDBACK SUMMARY ===\n")
-        
         feedback_col = self.get_feedback_column(data)
         if feedback_col is None:
             return "Error: Could not identify feedback column in data."
-            
+
         total_feedback = len(data)
-        results.append(f"Total feedback entries: {total_feedback}")
-        
+
+        # Convert and lowercase the column once; lengths, common words and
+        # sentiment are all derived from this single pass over the text
+        s = self._text_array(data, feedback_col)
+
         # Average feedback length
-        feedback_lengths = [len(str(row[feedback_col])) for _, row in data.iterrows()]
-        avg_length = sum(feedback_lengths) / len(feedback_lengths) if feedback_lengths else 0
-        results.append(f"Average feedback length: {avg_length:.1f} characters")
-        
+        avg_length = float(s.str.len().mean()) if total_feedback > 0 else 0
+
         # Most common words (for summary)
-        all_words = []
-        for _, row in data.iterrows():
-            feedback_text = str(row[feedback_col]).lower()
-            words = re.findall(r'\b[a-zA-Z]+\b', feedback_text)
-            all_words.extend(words)
-            
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        filtered_words = [word for word in all_words if word not in stop_words and len(word) > 2]
-        
-        word_counts = Counter(filtered_words)
-        top_words = word_counts.most_common(10)
-        
-        results.append("\nMost common themes:")
-        for word, count in top_words:
-            results.append(f"- {word} (mentioned {count} times)")
-            
+        s_no_stop = s.str.replace(self._stop_re, ' ', regex=True)
+        tokens = s_no_stop.str.findall(_WORD_RE).explode().dropna()
+        tokens = tokens[tokens.str.len() > 2]
+
+        # Count theme words with pandas' hashed C grouping
+        top_words = tokens.value_counts().head(10)
+        theme_lines = "\n".join(f"- {word} (mentioned {count} times)"
+                                for word, count in top_words.items())
+
         # Quick sentiment overview
-        positive_count = 0
-        negative_count = 0
-        
-        for _, row in data.iterrows():
-            feedback_text = str(row[feedback_col]).lower()
-            positive_words_found = sum(1 for word in self.positive_words if word in feedback_text)
-            negative_words_found = sum(1 for word in self.negative_words if word in feedback_text)
-            
-            if positive_words_found > negative_words_found:
-                positive_count += 1
-            elif negative_words_found > positive_words_found:
-                negative_count += 1
-                
-        results.append(f"\nQuick Sentiment Overview:")
-        results.append(f"- Positive feedback: {positive_count}")
-        results.append(f"- Negative feedback: {negative_count}")
-        results.append(f"- Neutral feedback: {total_feedback - positive_count - negative_count}")
-        
-        return "\n".join(results)
+        positive_count, negative_count = self._sentiment_counts(s)
+
+        return (
+            "=== FEEDBACK SUMMARY ===\n\n"
+            f"Total feedback entries: {total_feedback}\n"
+            f"Average feedback length: {avg_length:.1f} characters\n"
+            "\nMost common themes:"
+            + (f"\n{theme_lines}" if theme_lines else "")
+            + "\n\nQuick Sentiment Overview:\n"
+            f"- Positive feedback: {positive_count}\n"
+            f"- Negative feedback: {negative_count}\n"
+            f"- Neutral feedback: {total_feedback - positive_count - negative_count}"
+        )
         
     def get_feedback_column(self, data):
         """
@@ -312,18 +692,18 @@ class FeedbackProcessor:
         Returns:
             str: Column name containing feedback
         """
-        possible_names = ['feedback', 'review', 'comment', 'text', 'message', 'response']
-        
+        # Lower each column name once and test against the shared name
+        # substrings in a single pass
         for col in data.columns:
-            if any(name in col.lower() for name in possible_names):
+            lowered = col.lower()
+            if any(name in lowered for name in _FEEDBACK_COL_NAMES):
                 return col
-                
-        # If no obvious column name, use the first text column
-        for col in data.columns:
-            if data[col].dtype == 'object':
-                return col
-                
-        return None 
+
+        # If no obvious column name, use the first text column; check the
+        # dtype family rather than object so Arrow-backed string columns
+        # from load_data are recognized too
+        return next((col for col in data.columns
+                     if pd.api.types.is_string_dtype(data[col])), None)
 
     def export_results_as_json(self, results, filename):
         """
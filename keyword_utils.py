@@ -0,0 +1,108 @@
+"""
+Keyword Aggregation Utilities
+Fast frequency counting helpers for keyword analysis and visualization
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def build_vocabulary(tokens):
+    """
+    Map tokens to dense integer ids in a single pass
+
+    Args:
+        tokens (sequence): Sequence of token strings
+
+    Returns:
+        tuple: (vocabulary dict token -> id, int32 array of token ids)
+    """
+    vocabulary = {}
+    token_ids = np.empty(len(tokens), dtype=np.int32)
+    for i, token in enumerate(tokens):
+        token_ids[i] = vocabulary.setdefault(token, len(vocabulary))
+    return vocabulary, token_ids
+
+
+def _topk_counts_numpy(token_ids, vocab_size, k):
+    """NumPy fallback: bincount plus partial selection via argpartition"""
+    counts = np.bincount(token_ids, minlength=vocab_size).astype(np.int32)
+    k = min(k, vocab_size)
+    top = np.argpartition(counts, vocab_size - k)[vocab_size - k:]
+    order = np.argsort(counts[top])[::-1]
+    top = top[order].astype(np.int32)
+    return top, counts[top]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _topk_counts_jit(token_ids, vocab_size, k):
+        """JIT kernel: dense count array plus insertion-based top-k selection"""
+        counts = np.zeros(vocab_size, dtype=np.int32)
+        for t in token_ids:
+            counts[t] += 1
+
+        k = min(k, vocab_size)
+        top_ids = np.full(k, -1, dtype=np.int32)
+        top_counts = np.zeros(k, dtype=np.int32)
+        for v in range(vocab_size):
+            c = counts[v]
+            if c > top_counts[k - 1]:
+                i = k - 1
+                while i > 0 and top_counts[i - 1] < c:
+                    top_counts[i] = top_counts[i - 1]
+                    top_ids[i] = top_ids[i - 1]
+                    i -= 1
+                top_counts[i] = c
+                top_ids[i] = v
+
+        n = 0
+        for i in range(k):
+            if top_ids[i] >= 0:
+                n += 1
+        return top_ids[:n], top_counts[:n]
+
+
+def topk_counts(token_ids, vocab_size, k):
+    """
+    Return the ids and counts of the k most frequent tokens
+
+    Uses a Numba-compiled kernel when numba is installed, otherwise a
+    vectorized NumPy fallback.
+
+    Args:
+        token_ids (numpy.ndarray): int32 array of dense token ids
+        vocab_size (int): Number of distinct tokens
+        k (int): Number of top entries to return
+
+    Returns:
+        tuple: (top token ids, top counts), sorted by descending count
+    """
+    if vocab_size == 0 or len(token_ids) == 0:
+        empty = np.empty(0, dtype=np.int32)
+        return empty, empty
+    if NUMBA_AVAILABLE:
+        return _topk_counts_jit(token_ids, vocab_size, k)
+    return _topk_counts_numpy(token_ids, vocab_size, k)
+
+
+def aggregate_topk(tokens, k=15):
+    """
+    Aggregate raw tokens into the top-k (token, count) pairs
+
+    Args:
+        tokens (sequence): Sequence of token strings
+        k (int): Number of top entries to return
+
+    Returns:
+        list: List of (token, count) tuples sorted by descending count
+    """
+    vocabulary, token_ids = build_vocabulary(tokens)
+    id_to_token = list(vocabulary)
+    top_ids, top_counts = topk_counts(token_ids, len(vocabulary), k)
+    return [(id_to_token[i], int(c)) for i, c in zip(top_ids, top_counts)]